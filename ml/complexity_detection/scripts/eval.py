@@ -14,8 +14,8 @@ DEFAULT_EVAL = PROJECT_ROOT / "data" / "eval.csv"
 DEFAULT_TRAIN = PROJECT_ROOT / "data" / "training_data.csv"
 
 def softmax(x):
-    e = np.exp(x - np.max(x))
-    return e / e.sum()
+    e = np.exp(x - x.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
 
 def load_model():
     with open(MODEL_PATH, "r") as f:
@@ -27,18 +27,18 @@ def load_dataset(path: Path):
             path = DEFAULT_EVAL
         else:
             path = DEFAULT_TRAIN
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, usecols=["message", "label"], dtype={"message": "string", "label": "int8"}, engine="c")
     return df
 
 def predict_batch(model, texts):
-    vec = TfidfVectorizer(vocabulary=model["tfidf"]["vocabulary"])   
-    vec.idf_ = np.array(model["tfidf"]["idf_weights"])             
-    X = vec.transform(texts).toarray()
-    coefs = np.array(model["classifier"]["coefficients"])          
-    intercepts = np.array(model["classifier"]["intercepts"])       
+    vec = TfidfVectorizer(vocabulary=model["tfidf"]["vocabulary"], dtype=np.float32)
+    vec.idf_ = np.asarray(model["tfidf"]["idf_weights"], dtype=np.float32)
+    X = vec.transform(texts)
+    coefs = np.asarray(model["classifier"]["coefficients"], dtype=np.float32)
+    intercepts = np.asarray(model["classifier"]["intercepts"], dtype=np.float32)
     classes = model["classifier"]["classes"]                        
-    logits = X.dot(coefs.T) + intercepts
-    probs = np.apply_along_axis(softmax, 1, logits)
+    logits = X @ coefs.T + intercepts
+    probs = softmax(logits)
     idx = probs.argmax(axis=1)
     preds = [classes[i] for i in idx]
     return preds
@@ -47,11 +47,10 @@ def main():
     path = Path(sys.argv[1]) if len(sys.argv) > 1 else None
     model = load_model()
     df = load_dataset(path)
-    texts = df["message"].astype(str).tolist()
-    y_true = df["label"].tolist()
-    label_map = {"simple":0, "complex":1, "multistep":2}
+    texts = df["message"].to_numpy(dtype=object, na_value="")
+    y_true = df["label"].to_numpy()
     y_pred_text = predict_batch(model, texts)
-    y_pred = [label_map[x] for x in y_pred_text]
+    y_pred = pd.Categorical(y_pred_text, categories=["simple","complex","multistep"]).codes
     acc = accuracy_score(y_true, y_pred)
     print(f"Accuracy: {acc:.3f}")
     print(classification_report(y_true, y_pred, target_names=["simple","complex","multistep"], digits=3))
@@ -8,6 +8,7 @@ Usage:
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 import numpy as np
@@ -18,10 +19,22 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 MODEL_PATH = PROJECT_ROOT / "models" / "complexity_model.json"
 
+MULTISTEP_CUES = [' then ', ' and then ', ', then ', '; then ', ' after ', ' followed by ', ' first ', ' second ', ' third ']
+COMPLEX_CUES = ['oauth', 'oauth2', 'oidc', 'migrate', 'migration', 'deploy', 'docker', 'kubectl', 'k8s', 's3', 'pipeline', 'airflow', 'terraform', 'ansible', 'kafka', 'stripe', 'payment', 'upload', 'script', 'bash', 'nginx', 'logs']
+MULTISTEP_RE = re.compile('|'.join(map(re.escape, MULTISTEP_CUES)))
+COMPLEX_RE = re.compile('|'.join(map(re.escape, COMPLEX_CUES)))
+
 def softmax(x):
-    """Compute softmax values for array x."""
-    exp_x = np.exp(x - np.max(x))
-    return exp_x / exp_x.sum()
+    """Compute softmax values for array x (row-wise for 2D input)."""
+    exp_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return exp_x / exp_x.sum(axis=-1, keepdims=True)
+
+def softmax_argmax(scores):
+    """Return (argmax indices, softmax probabilities) along the last axis.
+
+    Softmax is monotonic, so the winning class is taken from the raw scores.
+    """
+    return scores.argmax(axis=-1), softmax(scores)
 
 def load_model():
     """Load model from JSON."""
@@ -33,34 +46,48 @@ def load_model():
     with open(MODEL_PATH, 'r') as f:
         model = json.load(f)
     
+    model['_class_idx'] = {c: i for i, c in enumerate(model['classifier']['classes'])}
     return model
 
-def predict(model, message):
-    vectorizer = TfidfVectorizer(vocabulary=model['tfidf']['vocabulary'])
-    vectorizer.idf_ = np.array(model['tfidf']['idf_weights'])
-    X = vectorizer.transform([message])
-    X_array = X.toarray()[0]
-    coefs = np.array(model['classifier']['coefficients'])
-    intercepts = np.array(model['classifier']['intercepts'])
-    classes = model['classifier']['classes']
-    scores = np.dot(coefs, X_array) + intercepts
-    text = f" {message.lower()} "
-    idx_simple = classes.index('simple') if 'simple' in classes else 0
-    idx_complex = classes.index('complex') if 'complex' in classes else 1
-    idx_multistep = classes.index('multistep') if 'multistep' in classes else 2
-    multistep_cues = [' then ', ' and then ', ', then ', '; then ', ' after ', ' followed by ', ' first ', ' second ', ' third ']
-    complex_cues = ['oauth', 'oauth2', 'oidc', 'migrate', 'migration', 'deploy', 'docker', 'kubectl', 'k8s', 's3', 'pipeline', 'airflow', 'terraform', 'ansible', 'kafka', 'stripe', 'payment', 'upload', 'script', 'bash', 'nginx', 'logs']
-    if any(c in text for c in multistep_cues):
-        scores[idx_multistep] += 1.0
-    if any(c in text for c in complex_cues):
-        scores[idx_complex] += 1.5
-    probs = softmax(scores)
-    pred_idx = int(np.argmax(probs))
-    return {
-        'label': classes[pred_idx],
-        'confidence': float(probs[pred_idx]),
-        'probabilities': {classes[i]: float(probs[i]) for i in range(len(classes))}
-    }
+class Predictor:
+    """Model state built once and reused across predictions."""
+
+    def __init__(self, model):
+        # float32 is plenty for this model and halves memory traffic
+        self.vectorizer = TfidfVectorizer(vocabulary=model['tfidf']['vocabulary'], dtype=np.float32)
+        self.vectorizer.idf_ = np.asarray(model['tfidf']['idf_weights'], dtype=np.float32)
+        self.coefs = np.asarray(model['classifier']['coefficients'], dtype=np.float32)
+        self.intercepts = np.asarray(model['classifier']['intercepts'], dtype=np.float32)
+        self.classes = model['classifier']['classes']
+        class_idx = model['_class_idx']
+        self.idx_simple = class_idx.get('simple', 0)
+        self.idx_complex = class_idx.get('complex', 1)
+        self.idx_multistep = class_idx.get('multistep', 2)
+
+    def predict(self, message):
+        return self.predict_many([message])[0]
+
+    def predict_many(self, messages):
+        """Predict a batch of messages with one transform and matmul."""
+        if not messages:
+            return []
+        X = self.vectorizer.transform(messages)
+        scores = X @ self.coefs.T + self.intercepts
+        texts = [f" {m.lower()} " for m in messages]
+        multistep = np.fromiter((MULTISTEP_RE.search(t) is not None for t in texts), dtype=bool, count=len(texts))
+        complex_ = np.fromiter((COMPLEX_RE.search(t) is not None for t in texts), dtype=bool, count=len(texts))
+        scores[multistep, self.idx_multistep] += 1.0
+        scores[complex_, self.idx_complex] += 1.5
+        pred_idx, probs = softmax_argmax(scores)
+        classes = self.classes
+        return [
+            {
+                'label': classes[k],
+                'confidence': float(row[k]),
+                'probabilities': {classes[i]: float(row[i]) for i in range(len(classes))}
+            }
+            for k, row in zip(pred_idx, probs)
+        ]
 
 def interactive_mode(model):
     """Interactive prediction mode."""
@@ -71,6 +98,8 @@ def interactive_mode(model):
     print("=" * 50)
     print("\nEnter task descriptions (or 'quit' to exit):\n")
     
+    predictor = Predictor(model)
+    
     while True:
         try:
             message = input("➤ ").strip()
@@ -82,7 +111,7 @@ def interactive_mode(model):
                 print("\n👋 Goodbye!")
                 break
             
-            result = predict(model, message)
+            result = predictor.predict(message)
             
             print(f"\n   Prediction: {result['label'].upper()}")
             print(f"   Confidence: {result['confidence']:.1%}")
@@ -105,7 +134,7 @@ def main():
     if len(sys.argv) > 1:
         # Single prediction mode
         message = " ".join(sys.argv[1:])
-        result = predict(model, message)
+        result = Predictor(model).predict(message)
         
         print(f"\nMessage: {message}")
         print(f"Prediction: {result['label']}")
@@ -20,6 +20,11 @@ from sklearn.model_selection import cross_val_score, train_test_split
 from sklearn.metrics import classification_report, confusion_matrix
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 DATA_PATH = PROJECT_ROOT / "data" / "training_data.csv"
@@ -34,11 +39,16 @@ LABELS = {
 def load_data():
     """Load and validate training data."""
     print(f"📂 Loading data from {DATA_PATH}")
-    df = pd.read_csv(DATA_PATH)
-    
     required_cols = ['message', 'label']
-    if not all(col in df.columns for col in required_cols):
-        raise ValueError(f"CSV must contain columns: {required_cols}")
+    try:
+        df = pd.read_csv(
+            DATA_PATH,
+            usecols=required_cols,
+            dtype={'message': 'string', 'label': 'int8'},
+            engine='c'
+        )
+    except ValueError as e:
+        raise ValueError(f"CSV must contain columns {required_cols} with integer labels: {e}") from e
     
     valid_labels = set(LABELS.keys())
     if not set(df['label'].unique()).issubset(valid_labels):
@@ -64,7 +74,8 @@ def train_model(df):
         min_df=2,
         max_df=0.85,
         lowercase=True,
-        strip_accents='unicode'
+        strip_accents='unicode',
+        dtype=np.float32
     )
     
     X_tfidf = vectorizer.fit_transform(X)
@@ -81,15 +92,15 @@ def train_model(df):
     clf.fit(X_tfidf, y)
     print(f"   Trained classifier on {len(X)} examples")
     
-    return vectorizer, clf
+    return vectorizer, clf, X_tfidf
 
-def evaluate_model(vectorizer, clf, df):
-    """Evaluate model performance."""
+def evaluate_model(vectorizer, clf, df, X_tfidf=None):
+    """Evaluate model performance, reusing training features when given."""
     print("\n📊 Evaluating model...")
     
-    X = df['message'].values
     y = df['label'].values
-    X_tfidf = vectorizer.transform(X)
+    if X_tfidf is None:
+        X_tfidf = vectorizer.transform(df['message'].values)
     
     cv_scores = cross_val_score(clf, X_tfidf, y, cv=5, scoring='accuracy')
     print(f"   Cross-validation accuracy: {cv_scores.mean():.3f} (+/- {cv_scores.std() * 2:.3f})")
@@ -126,6 +137,12 @@ def evaluate_model(vectorizer, clf, df):
     
     return cv_scores.mean()
 
+def _topk(row, k):
+    """Indices of the k largest values in row, in descending order."""
+    k = min(k, row.size)
+    part = np.argpartition(row, -k)[-k:]
+    return part[np.argsort(row[part])[::-1]]
+
 def export_model(vectorizer, clf, accuracy, num_examples):
     """Export model weights as JSON for Go embedding."""
     print(f"\n💾 Exporting model to {MODEL_OUTPUT}")
@@ -146,18 +163,23 @@ def export_model(vectorizer, clf, accuracy, num_examples):
         
         "tfidf": {
             "vocabulary": vocabulary,
-            "idf_weights": vectorizer.idf_.tolist()
+            "idf_weights": vectorizer.idf_
         },
         
         "classifier": {
-            "coefficients": clf.coef_.tolist(),
-            "intercepts": clf.intercept_.tolist(),
+            "coefficients": np.ascontiguousarray(clf.coef_),
+            "intercepts": clf.intercept_,
             "classes": [LABELS[int(c)] for c in clf.classes_]
         }
     }
     
-    with open(MODEL_OUTPUT, 'w') as f:
-        json.dump(model_data, f, indent=2)
+    if orjson is not None:
+        MODEL_OUTPUT.write_bytes(orjson.dumps(
+            model_data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        ))
+    else:
+        with open(MODEL_OUTPUT, 'w') as f:
+            json.dump(model_data, f, indent=2, default=lambda a: a.tolist())
     
     file_size_kb = MODEL_OUTPUT.stat().st_size / 1024
     print(f"✅ Model exported successfully")
@@ -168,7 +190,7 @@ def export_model(vectorizer, clf, accuracy, num_examples):
     print("\n🔍 Top predictive features per class:")
     feature_names = vectorizer.get_feature_names_out()
     for i, class_name in enumerate([LABELS[c] for c in sorted(LABELS.keys())]):
-        top_indices = np.argsort(clf.coef_[i])[-5:][::-1]
+        top_indices = _topk(clf.coef_[i], 5)
         top_features = [feature_names[idx] for idx in top_indices]
         print(f"   {class_name:>10}: {', '.join(top_features)}")
 
@@ -180,9 +202,9 @@ def main():
     
     df = load_data()
     
-    vectorizer, clf = train_model(df)
+    vectorizer, clf, X_tfidf = train_model(df)
     
-    accuracy = evaluate_model(vectorizer, clf, df)
+    accuracy = evaluate_model(vectorizer, clf, df, X_tfidf)
     
     export_model(vectorizer, clf, accuracy, len(df))
     
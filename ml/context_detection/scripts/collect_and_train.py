@@ -7,6 +7,7 @@ import json
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pandas as pd
@@ -39,6 +40,13 @@ REPOS = {
     ],
 }
 
+def _walk_match(root, predicate):
+    """Lazily yield files under root whose name matches predicate"""
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if predicate(name):
+                yield os.path.join(dirpath, name)
+
 def run_chu_detect(repo_dir):
     """Run chu detect-language and parse output"""
     chu_bin = Path(__file__).parent.parent.parent.parent / "bin" / "chu"
@@ -83,28 +91,20 @@ def run_chu_detect(repo_dir):
     repo_path = Path(repo_dir)
     has_docs = int((repo_path / "README.md").exists())
     
-    has_tests = 0
-    for p in repo_path.rglob("*test*"):
-        if p.is_file():
-            has_tests = 1
-            break
+    has_tests = int(any(_walk_match(repo_dir, lambda name: "test" in name)))
     
+    # Classify top-level scripts/infra files in a single directory read
     has_scripts = 0
-    for ext in ["*.sh", "Makefile"]:
-        if list(repo_path.glob(ext)):
-            has_scripts = 1
-            break
-    
     has_infra = 0
-    for pattern in ["Dockerfile", "*.tf"]:
-        if list(repo_path.glob(pattern)):
-            has_infra = 1
-            break
+    with os.scandir(repo_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name == "Makefile" or name.endswith(".sh"):
+                has_scripts = 1
+            elif name == "Dockerfile" or name.endswith(".tf"):
+                has_infra = 1
     
-    has_data = 0
-    csvs = list(repo_path.rglob("*.csv"))
-    if len(csvs) > 0:
-        has_data = 1
+    has_data = int(any(_walk_match(repo_dir, lambda name: name.endswith(".csv"))))
     
     return {
         "language_count": lang_count,
@@ -117,42 +117,58 @@ def run_chu_detect(repo_dir):
         "has_data": has_data,
     }
 
-def collect_samples():
+def process_repo(context, repo, tmpdir):
+    """Clone a repo and extract its features; returns (features, error)"""
+    repo_name = repo.replace("/", "_")
+    repo_dir = Path(tmpdir) / repo_name
+    
+    # Clone repo
+    result = subprocess.run(
+        ["gh", "repo", "clone", repo, str(repo_dir), "--", "--depth", "1"],
+        capture_output=True
+    )
+    
+    if result.returncode != 0:
+        return None, "Failed to clone"
+    
+    # Extract features
+    features = run_chu_detect(repo_dir)
+    
+    if features is None:
+        return None, "Failed to extract features"
+    
+    features["context"] = context
+    return features, None
+
+def collect_samples(max_workers=8):
     """Collect samples from GitHub repos"""
-    samples = []
+    jobs = [(context, repo) for context, repos in REPOS.items() for repo in repos]
+    results = {}
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        for context, repos in REPOS.items():
-            print(f"Collecting {context} samples...")
+        # Clones are network-bound and detection runs in a subprocess, so
+        # threads overlap both without contending on the GIL
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(process_repo, context, repo, tmpdir): i
+                for i, (context, repo) in enumerate(jobs)
+            }
+            print(f"Processing {len(jobs)} repos with {max_workers} workers...")
             
-            for repo in repos:
-                print(f"  Processing {repo}...")
-                
-                repo_name = repo.replace("/", "_")
-                repo_dir = Path(tmpdir) / repo_name
-                
-                # Clone repo
-                result = subprocess.run(
-                    ["gh", "repo", "clone", repo, str(repo_dir), "--", "--depth", "1"],
-                    capture_output=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"    Failed to clone")
-                    continue
-                
-                # Extract features
-                features = run_chu_detect(repo_dir)
+            for future in as_completed(futures):
+                i = futures[future]
+                context, repo = jobs[i]
+                features, error = future.result()
                 
-                if features is None:
-                    print(f"    Failed to extract features")
+                if error:
+                    print(f"  {repo} ({context}): {error}")
                     continue
                 
-                features["context"] = context
-                samples.append(features)
-                print(f"    Added sample")
+                results[i] = features
+                print(f"  {repo} ({context}): Added sample")
     
-    return samples
+    # Keep samples in REPOS order regardless of completion order
+    return [results[i] for i in sorted(results)]
 
 def main():
     script_dir = Path(__file__).parent
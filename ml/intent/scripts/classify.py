@@ -12,13 +12,55 @@ import csv
 from pathlib import Path
 from collections import Counter
 
+import numpy as np
+
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 NL2BASH_DATA = PROJECT_ROOT / "data" / "nl-request-data.txt"
 OUTPUT_CSV = PROJECT_ROOT / "data" / "training_data_expanded.csv"
 MERGED_CSV = PROJECT_ROOT / "data" / "training_data_merged.csv"
 
-def categorize_request(text):
+# simplify_nl2bash_text patterns, compiled once
+_RE_LINENO = re.compile(r'^\d+\|')
+_RE_OS_TAG = re.compile(r'\((?:GNU|BSD|Linux|Mac OSX)[\s-]specific\)\s*', re.IGNORECASE)
+_RE_QUOTES = re.compile(r'["\']([^"\']+)["\']')
+_VERB_REPLACEMENTS = {
+    'Display ': 'display ',
+    'Calculate ': 'calculate ',
+    'Retrieve ': 'get ',
+    'Monitor ': 'monitor ',
+    'Find ': 'find ',
+}
+_RE_VERBS = re.compile('|'.join(map(re.escape, _VERB_REPLACEMENTS)))
+
+def _verb_repl(m):
+    return _VERB_REPLACEMENTS[m.group(0)]
+
+# Editor: commands that modify files/system
+EDIT_PATTERNS = [
+    'add ', 'remove ', 'delete ', 'rename ', 'move ', 'copy ',
+    'create ', 'modify ', 'change ', 'update ', 'replace ',
+    'append ', 'prepend ', 'insert ', 'chmod ', 'chown ',
+    'mkdir ', 'rmdir ', 'touch ', 'truncate ', 'write ',
+    'extract ', 'compress ', 'archive and compress',
+    'permission', 'install ', 'set variable', 'adjust '
+]
+
+# Query: commands that read/display information
+QUERY_PATTERNS = [
+    'display ', 'show ', 'list ', 'find ', 'search ',
+    'count ', 'calculate ', 'monitor ', 'check ',
+    'get ', 'retrieve ', 'output ', 'print ',
+    'view ', 'read ', 'look for', 'grep ',
+    'diff', 'status', 'log', 'history',
+    'page through', 'interactively display', 'collect '
+]
+
+# Each pattern list compiled into a single alternation, scanned in one pass
+_EDIT_RE = re.compile('|'.join(map(re.escape, EDIT_PATTERNS)))
+_QUERY_RE = re.compile('|'.join(map(re.escape, QUERY_PATTERNS)))
+
+def categorize_request(text_lower):
     """
     Categorize NL2Bash requests into intent categories.
     
@@ -28,38 +70,16 @@ def categorize_request(text):
     - research: External information (N/A for shell commands)
     - review: Code analysis (N/A for shell commands)
     - router: Greetings/meta (N/A for shell commands)
-    """
-    text_lower = text.lower()
-    
-    # Editor: commands that modify files/system
-    edit_patterns = [
-        'add ', 'remove ', 'delete ', 'rename ', 'move ', 'copy ',
-        'create ', 'modify ', 'change ', 'update ', 'replace ',
-        'append ', 'prepend ', 'insert ', 'chmod ', 'chown ',
-        'mkdir ', 'rmdir ', 'touch ', 'truncate ', 'write ',
-        'extract ', 'compress ', 'archive and compress',
-        'permission', 'install ', 'set variable', 'adjust '
-    ]
-    
-    # Query: commands that read/display information
-    query_patterns = [
-        'display ', 'show ', 'list ', 'find ', 'search ',
-        'count ', 'calculate ', 'monitor ', 'check ',
-        'get ', 'retrieve ', 'output ', 'print ',
-        'view ', 'read ', 'look for', 'grep ',
-        'diff', 'status', 'log', 'history',
-        'page through', 'interactively display', 'collect '
-    ]
     
+    Expects the request already lowercased by the caller.
+    """
     # Check editor first (more specific)
-    for pattern in edit_patterns:
-        if pattern in text_lower:
-            return 'editor'
+    if _EDIT_RE.search(text_lower):
+        return 'editor'
     
     # Then check query
-    for pattern in query_patterns:
-        if pattern in text_lower:
-            return 'query'
+    if _QUERY_RE.search(text_lower):
+        return 'query'
     
     # Archive operations without modification
     if 'archive ' in text_lower and 'compress' not in text_lower:
@@ -74,20 +94,16 @@ def simplify_nl2bash_text(text):
     Convert technical NL2Bash descriptions to natural user messages.
     """
     # Remove line number prefix
-    text = re.sub(r'^\d+\|', '', text)
+    text = _RE_LINENO.sub('', text)
     
     # Remove OS-specific tags
-    text = re.sub(r'\((?:GNU|BSD|Linux|Mac OSX)[\s-]specific\)\s*', '', text, flags=re.IGNORECASE)
+    text = _RE_OS_TAG.sub('', text)
     
     # Remove quotes
-    text = re.sub(r'["\']([^"\']+)["\']', r'\1', text)
+    text = _RE_QUOTES.sub(r'\1', text)
     
     # Simplify capitalization
-    text = text.replace('Display ', 'display ')
-    text = text.replace('Calculate ', 'calculate ')
-    text = text.replace('Retrieve ', 'get ')
-    text = text.replace('Monitor ', 'monitor ')
-    text = text.replace('Find ', 'find ')
+    text = _RE_VERBS.sub(_verb_repl, text)
     
     return text.strip()
 
@@ -98,27 +114,26 @@ def process_nl2bash():
     if not NL2BASH_DATA.exists():
         raise FileNotFoundError(f"NL2Bash data not found: {NL2BASH_DATA}")
     
-    with open(NL2BASH_DATA, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    print(f"   Loaded {len(lines)} examples from NL2Bash")
-    
-    # Process and categorize
+    # Process and categorize while streaming the corpus
     processed = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        category = categorize_request(line)
-        message = simplify_nl2bash_text(line)
-        
-        if message and len(message) > 10:  # Filter very short messages
-            processed.append({
-                'message': message,
-                'label': category
-            })
-    
+    total = 0
+    with open(NL2BASH_DATA, 'r', encoding='utf-8') as f:
+        for line in f:
+            total += 1
+            line = line.strip()
+            if not line:
+                continue
+            
+            category = categorize_request(line.lower())
+            message = simplify_nl2bash_text(line)
+            
+            if message and len(message) > 10:  # Filter very short messages
+                processed.append({
+                    'message': message,
+                    'label': category
+                })
+    
+    print(f"   Loaded {total} examples from NL2Bash")
     print(f"   Processed {len(processed)} examples")
     
     # Count by category
@@ -153,11 +168,11 @@ def merge_with_existing(expanded_data):
     
     # Sample from expanded to balance dataset
     # Add 500-1000 shell examples without overwhelming
-    from random import sample, seed
-    seed(42)  # Reproducible
+    rng = np.random.default_rng(42)  # Reproducible
     
     sample_size = min(1000, len(expanded_data))
-    sampled = sample(expanded_data, sample_size)
+    idx = rng.choice(len(expanded_data), size=sample_size, replace=False)
+    sampled = [expanded_data[i] for i in idx]
     
     print(f"   Sampled from NL2Bash: {len(sampled)}")
     
@@ -5,69 +5,117 @@ Process user feedback from ~/.gptcode/feedback/*.json into training data.
 Converts feedback events into intent classification training examples.
 Bad feedback with task info can help improve model accuracy.
 """
+import functools
 import json
-import csv
+import re
+import multiprocessing
 from pathlib import Path
 from collections import Counter
 from datetime import datetime
 
+import pandas as pd
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional: falls back to stdlib json
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # optional: large files are parsed in one go
+    ijson = None
+
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 FEEDBACK_DIR = Path.home() / ".gptcode" / "feedback"
 OUTPUT_CSV = PROJECT_ROOT / "data" / "training_data_feedback.csv"
+PARALLEL_MIN_FILES = 8
+STREAM_MIN_BYTES = 1_000_000
+
+# Editor patterns
+EDIT_KEYWORDS = [
+    'add ', 'create ', 'implement ', 'fix ', 'refactor ', 'update ',
+    'modify ', 'change ', 'remove ', 'delete ', 'write '
+]
+
+# Query patterns
+QUERY_KEYWORDS = [
+    'how ', 'what ', 'where ', 'show ', 'list ', 'find ', 'search ',
+    'explain ', 'display ', 'get ', 'check ', 'run ', 'execute ',
+    'rodar ', 'como ', 'onde '  # Portuguese
+]
 
+# Research patterns
+RESEARCH_KEYWORDS = [
+    'best practices', 'compare ', 'research ', 'investigate ',
+    'documentation ', 'tutorial ', 'example '
+]
+
+# Review patterns
+REVIEW_KEYWORDS = [
+    'review ', 'analyze ', 'audit ', 'check for bugs',
+    'security ', 'vulnerability '
+]
+
+# Intents in order of specificity; each becomes a named group of one regex
+INTENT_KEYWORDS = [
+    ('editor', EDIT_KEYWORDS),
+    ('review', REVIEW_KEYWORDS),
+    ('research', RESEARCH_KEYWORDS),
+    ('query', QUERY_KEYWORDS),
+]
+INTENT_PRIORITY = {intent: i for i, (intent, _) in enumerate(INTENT_KEYWORDS)}
+INTENT_RE = re.compile('|'.join(
+    f"(?P<{intent}>{'|'.join(map(re.escape, keywords))})"
+    for intent, keywords in INTENT_KEYWORDS
+))
+
+@functools.lru_cache(maxsize=8192)
 def infer_intent_from_task(task):
     """
     Infer intent from task description.
     
     This is a heuristic - ideally user would provide correct intent in feedback.
+    Results are cached since retried tasks repeat the same description.
     """
     task_lower = task.lower()
     
-    # Editor patterns
-    edit_keywords = [
-        'add ', 'create ', 'implement ', 'fix ', 'refactor ', 'update ',
-        'modify ', 'change ', 'remove ', 'delete ', 'write '
-    ]
-    
-    # Query patterns  
-    query_keywords = [
-        'how ', 'what ', 'where ', 'show ', 'list ', 'find ', 'search ',
-        'explain ', 'display ', 'get ', 'check ', 'run ', 'execute ',
-        'rodar ', 'como ', 'onde '  # Portuguese
-    ]
-    
-    # Research patterns
-    research_keywords = [
-        'best practices', 'compare ', 'research ', 'investigate ',
-        'documentation ', 'tutorial ', 'example '
-    ]
-    
-    # Review patterns
-    review_keywords = [
-        'review ', 'analyze ', 'audit ', 'check for bugs',
-        'security ', 'vulnerability '
-    ]
-    
-    # Check in order of specificity
-    for keyword in edit_keywords:
-        if keyword in task_lower:
-            return 'editor'
-    
-    for keyword in review_keywords:
-        if keyword in task_lower:
-            return 'review'
-    
-    for keyword in research_keywords:
-        if keyword in task_lower:
-            return 'research'
-    
-    for keyword in query_keywords:
-        if keyword in task_lower:
-            return 'query'
+    # One pass over the task; the most specific intent seen wins
+    best = None
+    for match in INTENT_RE.finditer(task_lower):
+        intent = match.lastgroup
+        if best is None or INTENT_PRIORITY[intent] < INTENT_PRIORITY[best]:
+            best = intent
+            if INTENT_PRIORITY[best] == 0:
+                break
     
     # Default for shell/command execution
-    return 'query'
+    return best or 'query'
+
+def _stream_feedback_file(json_file):
+    """Stream events from a top-level JSON array; None if not an array."""
+    with open(json_file, 'rb') as f:
+        if f.read(1024).lstrip()[:1] != b'[':
+            return None
+        f.seek(0)
+        return list(ijson.items(f, 'item', use_float=True))
+
+def _parse_feedback_file(json_file):
+    """Parse one feedback file; returns (events, error)."""
+    try:
+        file_events = None
+        if ijson is not None and json_file.stat().st_size >= STREAM_MIN_BYTES:
+            file_events = _stream_feedback_file(json_file)
+        if file_events is None:
+            file_events = json_loads(json_file.read_bytes())
+    except Exception as e:
+        return [], f"Failed to load {json_file}: {e}"
+    
+    if isinstance(file_events, list):
+        return file_events, None
+    if isinstance(file_events, dict):
+        return [file_events], None
+    return [], None
 
 def load_feedback_events():
     """Load all feedback events from ~/.gptcode/feedback/*.json"""
@@ -75,18 +123,23 @@ def load_feedback_events():
         print(f"No feedback directory found: {FEEDBACK_DIR}")
         return []
     
+    files = list(FEEDBACK_DIR.glob("*.json"))
     events = []
-    for json_file in FEEDBACK_DIR.glob("*.json"):
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                file_events = json.load(f)
-                if isinstance(file_events, list):
-                    events.extend(file_events)
-                elif isinstance(file_events, dict):
-                    events.append(file_events)
-        except Exception as e:
-            print(f"Warning: Failed to load {json_file}: {e}")
-            continue
+    
+    def collect(results):
+        for file_events, error in results:
+            if error:
+                print(f"Warning: {error}")
+                continue
+            events.extend(file_events)
+    
+    # Files are independent, so parse them across cores once there are enough
+    # to amortize the pool startup
+    if len(files) < PARALLEL_MIN_FILES:
+        collect(map(_parse_feedback_file, files))
+    else:
+        with multiprocessing.Pool() as pool:
+            collect(pool.imap(_parse_feedback_file, files, chunksize=16))
     
     return events
 
@@ -103,29 +156,25 @@ def process_feedback_to_training_data():
     print(f"   Loaded {len(events)} feedback events")
     
     # Filter and convert to training examples
-    training_examples = []
-    
-    for event in events:
-        task = event.get('task', '') or event.get('context', '')
-        
-        if not task or len(task) < 5:
-            continue
-        
-        sentiment = event.get('sentiment', '')
-        
-        # For now, we only use bad feedback to generate training data
-        # Good feedback confirms existing behavior
-        if sentiment == 'bad' and task:
-            # Infer the correct intent
-            # In future, we could prompt user for correct intent
-            intent = infer_intent_from_task(task)
-            
-            training_examples.append({
-                'message': task,
-                'label': intent,
-                'source': 'feedback',
-                'timestamp': event.get('timestamp', '')
-            })
+    df = pd.DataFrame([e for e in events if isinstance(e, dict)])
+    df = df.reindex(columns=['task', 'context', 'sentiment', 'timestamp'])
+    
+    task = df['task'].fillna('')
+    task = task.where(task.astype(bool), df['context'].fillna(''))
+    
+    # For now, we only use bad feedback to generate training data
+    # Good feedback confirms existing behavior
+    mask = (task.str.len() >= 5) & df['sentiment'].eq('bad')
+    
+    # Infer the correct intent
+    # In future, we could prompt user for correct intent
+    messages = task[mask]
+    training_examples = pd.DataFrame({
+        'message': messages,
+        'label': messages.map(infer_intent_from_task),
+        'source': 'feedback',
+        'timestamp': df['timestamp'][mask].fillna('')
+    }).to_dict('records')
     
     print(f"   Generated {len(training_examples)} training examples from bad feedback")
     
@@ -135,6 +184,9 @@ def process_feedback_to_training_data():
     for intent, count in sorted(intent_counts.items()):
         print(f"     {intent}: {count}")
     
+    cache = infer_intent_from_task.cache_info()
+    print(f"   Intent cache: {cache.hits} hits, {cache.misses} misses (size {cache.currsize}/{cache.maxsize})")
+    
     return training_examples
 
 def save_training_data(examples):
@@ -145,14 +197,8 @@ def save_training_data(examples):
     
     OUTPUT_CSV.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['message', 'label'])
-        writer.writeheader()
-        for ex in examples:
-            writer.writerow({
-                'message': ex['message'],
-                'label': ex['label']
-            })
+    df = pd.DataFrame(examples, columns=['message', 'label'])
+    df.to_csv(OUTPUT_CSV, index=False, encoding='utf-8')
     
     print(f"\n✅ Saved {len(examples)} examples to {OUTPUT_CSV}")
 
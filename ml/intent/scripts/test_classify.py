@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Golden-output checks for simplify_nl2bash_text against the original
+sequential re.sub / str.replace implementation.
+"""
+import random
+import re
+
+from classify import simplify_nl2bash_text
+
+def reference_simplify(text):
+    """The original, uncompiled implementation."""
+    text = re.sub(r'^\d+\|', '', text)
+    text = re.sub(r'\((?:GNU|BSD|Linux|Mac OSX)[\s-]specific\)\s*', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'["\']([^"\']+)["\']', r'\1', text)
+    text = text.replace('Display ', 'display ')
+    text = text.replace('Calculate ', 'calculate ')
+    text = text.replace('Retrieve ', 'get ')
+    text = text.replace('Monitor ', 'monitor ')
+    text = text.replace('Find ', 'find ')
+    return text.strip()
+
+GOLDEN = [
+    ("12|Find all *.txt files", "find all *.txt files"),
+    ("Show 'Find' the files", "Show find the files"),
+    ("(gnu-specific)\"b c", "\"b c"),
+    ("(GNU specific) Display \"foo\" in Mac", "display foo in Mac"),
+    ("Retrieve 'Calculate ' totals", "get calculate  totals"),
+]
+
+TOKENS = [
+    "Find", "Display", "Calculate", "Retrieve", "Monitor", "find", " ", "  ",
+    "'", '"', "(GNU-specific)", "(gnu specific)", "(BSD specific)",
+    "(Mac OSX-specific)", "12|", "|", "3", "a", "files", "x y",
+]
+
+def test_golden_cases():
+    for text, expected in GOLDEN:
+        assert reference_simplify(text) == expected
+        assert simplify_nl2bash_text(text) == expected
+
+def test_matches_reference_on_random_token_strings():
+    rng = random.Random(42)
+    for _ in range(20000):
+        text = "".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 12)))
+        assert simplify_nl2bash_text(text) == reference_simplify(text), text
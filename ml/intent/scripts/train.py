@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import cross_val_score, train_test_split
+from sklearn.model_selection import StratifiedKFold, cross_validate
 from sklearn.metrics import classification_report, confusion_matrix
 import numpy as np
 
@@ -26,16 +26,24 @@ LABELS = {
 
 LABEL_TO_ID = {v: k for k, v in LABELS.items()}
 
+def read_csv(path):
+    """Read a CSV with Arrow's multithreaded parser when pyarrow is available."""
+    try:
+        return pd.read_csv(path, engine='pyarrow')
+    except (ImportError, ValueError):
+        # pyarrow missing, or input it can't parse (e.g. newlines in quotes)
+        return pd.read_csv(path)
+
 def load_data():
     """Load and validate training data."""
     print(f"📂 Loading data from {DATA_PATH}")
-    df = pd.read_csv(DATA_PATH)
+    df = read_csv(DATA_PATH)
     
     # Auto-detect and merge feedback data if exists
     feedback_count = 0
     if FEEDBACK_PATH.exists():
         print(f"📂 Detected feedback data at {FEEDBACK_PATH}")
-        df_feedback = pd.read_csv(FEEDBACK_PATH)
+        df_feedback = read_csv(FEEDBACK_PATH)
         feedback_count = len(df_feedback)
         
         # Duplicate feedback examples for higher weight (2x)
@@ -78,12 +86,18 @@ def train_model(df):
     )
     
     X_tfidf = vectorizer.fit_transform(X)
+    # Older sklearn keeps every pruned n-gram in stop_words_ for introspection
+    # only; drop it so the vectorizer holds just the exported vocabulary
+    if hasattr(vectorizer, 'stop_words_'):
+        del vectorizer.stop_words_
     print(f"   Vocabulary size: {len(vectorizer.vocabulary_)}")
     
+    # saga works on the sparse TF-IDF rows directly; multinomial is already
+    # the default for multiclass targets
     clf = LogisticRegression(
-        multi_class='multinomial',
-        solver='lbfgs',
-        max_iter=1000,
+        solver='saga',
+        max_iter=200,
+        tol=1e-3,
         class_weight='balanced',
         C=1.0,
         random_state=42
@@ -92,33 +106,29 @@ def train_model(df):
     clf.fit(X_tfidf, y)
     print("   Training complete")
     
-    return vectorizer, clf
+    return vectorizer, clf, X_tfidf
 
-def evaluate_model(vectorizer, clf, df):
-    """Evaluate model performance."""
+def evaluate_model(vectorizer, clf, df, X_tfidf=None):
+    """Evaluate model performance, reusing training features when given."""
     print("\n📊 Evaluating model...")
     
-    X = df['message'].values
     y = df['label'].values
-    X_tfidf = vectorizer.transform(X)
-    
-    cv_scores = cross_val_score(clf, X_tfidf, y, cv=3, scoring='accuracy')
-    print(f"   Cross-validation accuracy: {cv_scores.mean():.3f} (+/- {cv_scores.std() * 2:.3f})")
+    if X_tfidf is None:
+        X_tfidf = vectorizer.transform(df['message'].values)
     
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_tfidf, y, test_size=0.2, random_state=42, stratify=y
+    cv = StratifiedKFold(n_splits=3, shuffle=True, random_state=42)
+    cv_results = cross_validate(
+        clf, X_tfidf, y, cv=cv, scoring='accuracy',
+        return_estimator=True, return_indices=True, n_jobs=-1
     )
+    cv_scores = cv_results['test_score']
+    print(f"   Cross-validation accuracy: {cv_scores.mean():.3f} (+/- {cv_scores.std() * 2:.3f})")
     
-    clf_eval = LogisticRegression(
-        multi_class='multinomial',
-        solver='lbfgs',
-        max_iter=1000,
-        class_weight='balanced',
-        C=1.0,
-        random_state=42
-    )
-    clf_eval.fit(X_train, y_train)
-    y_pred = clf_eval.predict(X_test)
+    # Report on the first fold's held-out split instead of fitting a 4th model
+    clf_eval = cv_results['estimator'][0]
+    test_idx = cv_results['indices']['test'][0]
+    y_test = y[test_idx]
+    y_pred = clf_eval.predict(X_tfidf[test_idx])
     
     print("\n📈 Classification Report:")
     print(classification_report(
@@ -170,8 +180,8 @@ if __name__ == "__main__":
     
     try:
         df = load_data()
-        vectorizer, clf = train_model(df)
-        accuracy = evaluate_model(vectorizer, clf, df)
+        vectorizer, clf, X_tfidf = train_model(df)
+        accuracy = evaluate_model(vectorizer, clf, df, X_tfidf)
         export_model(vectorizer, clf, accuracy, len(df))
         print("\n" + "=" * 60)
         print("✨ Done!")
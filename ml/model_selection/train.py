@@ -12,16 +12,32 @@ Output: model_id (best model to use)
 Training data comes from feedback history.
 """
 import json
+import multiprocessing
 import os
+import re
 from pathlib import Path
-from collections import Counter
 
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.inspection import permutation_importance
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import accuracy_score, classification_report
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional: falls back to stdlib json
+    json_loads = json.loads
+
+PARALLEL_MIN_FILES = 8
+
+def _parse_feedback_file(file_path):
+    """Parse one feedback file; returns (events, error)"""
+    try:
+        return json_loads(file_path.read_bytes()), None
+    except Exception as e:
+        return [], f"Error loading {file_path}: {e}"
+
 def load_feedback_data():
     """Load all feedback events from ~/.gptcode/feedback/"""
     home = Path.home()
@@ -31,115 +47,126 @@ def load_feedback_data():
         print(f"No feedback directory found at {feedback_dir}")
         return []
     
+    files = list(feedback_dir.glob("*.json"))
     all_events = []
-    for file_path in feedback_dir.glob("*.json"):
-        try:
-            with open(file_path) as f:
-                events = json.load(f)
-                all_events.extend(events)
-        except Exception as e:
-            print(f"Error loading {file_path}: {e}")
+    
+    def collect(results):
+        for events, error in results:
+            if error:
+                print(error)
+                continue
+            all_events.extend(events)
+    
+    # Parse files across cores once there are enough to amortize the pool
+    if len(files) < PARALLEL_MIN_FILES:
+        collect(map(_parse_feedback_file, files))
+    else:
+        with multiprocessing.Pool() as pool:
+            collect(pool.imap(_parse_feedback_file, files, chunksize=16))
     
     return all_events
 
+ACTION_MAP = {
+    'editor': 'edit',
+    'reviewer': 'review',
+    'validator': 'review',
+    'planner': 'plan',
+    'research': 'research'
+}
+
+# Checked in order; the first extension found in the task wins
+LANGUAGE_EXTENSIONS = [
+    ('go', ['.go']),
+    ('python', ['.py']),
+    ('typescript', ['.ts', '.js']),
+    ('elixir', ['.ex', '.exs']),
+]
+
+COMPLEX_WORDS = ['refactor', 'reorganize', 'complex', 'system']
+MEDIUM_WORDS = ['multiple', 'all', 'entire']
+
+def _contains_any(series, words):
+    """Vectorized substring test of series against any of words"""
+    return series.str.contains('|'.join(map(re.escape, words)), regex=True)
+
 def convert_to_training_data(events):
     """Convert feedback events to ML training format"""
-    data = []
-    
-    for event in events:
-        # Skip events without required fields
-        if not event.get('model') or not event.get('agent') or not event.get('task'):
-            continue
-        
-        # Map agent to action
-        agent = event['agent'].lower()
-        action_map = {
-            'editor': 'edit',
-            'reviewer': 'review',
-            'validator': 'review',
-            'planner': 'plan',
-            'research': 'research'
-        }
-        action = action_map.get(agent)
-        if not action:
-            continue
-        
-        # Extract language from task
-        task = event.get('task', '').lower()
-        language = 'unknown'
-        if '.go' in task:
-            language = 'go'
-        elif '.py' in task:
-            language = 'python'
-        elif '.ts' in task or '.js' in task:
-            language = 'typescript'
-        elif '.ex' in task or '.exs' in task:
-            language = 'elixir'
-        
-        # Determine complexity
-        complexity = 'simple'
-        if any(word in task for word in ['refactor', 'reorganize', 'complex', 'system']):
-            complexity = 'complex'
-        elif any(word in task for word in ['multiple', 'all', 'entire']):
-            complexity = 'medium'
-        
-        # Success from sentiment
-        success = event.get('sentiment') == 'good'
-        
-        # Only learn from successful executions
-        # (We know what works, not just what doesn't)
-        if success:
-            data.append({
-                'action': action,
-                'language': language,
-                'complexity': complexity,
-                'model': event['model'],
-                'backend': event.get('backend', 'unknown')
-            })
-    
-    return data
+    required = ['model', 'agent', 'task', 'sentiment']
+    df = pd.DataFrame([e for e in events if isinstance(e, dict)])
+    if df.empty or not all(col in df.columns for col in required):
+        return []
+    
+    # Skip events without required fields
+    df = df[df[['model', 'agent', 'task']].fillna('').astype(bool).all(axis=1)]
+    
+    # Only learn from successful executions
+    # (We know what works, not just what doesn't)
+    df = df[df['sentiment'].eq('good')]
+    
+    # Map agent to action
+    action = df['agent'].str.lower().map(ACTION_MAP)
+    df = df[action.notna()]
+    action = action[action.notna()]
+    
+    # Extract language from task
+    task = df['task'].str.lower()
+    language = np.select(
+        [_contains_any(task, exts) for _, exts in LANGUAGE_EXTENSIONS],
+        [lang for lang, _ in LANGUAGE_EXTENSIONS],
+        default='unknown'
+    )
+    
+    # Determine complexity
+    complexity = np.select(
+        [_contains_any(task, COMPLEX_WORDS), _contains_any(task, MEDIUM_WORDS)],
+        ['complex', 'medium'],
+        default='simple'
+    )
+    
+    backend = df['backend'].fillna('unknown') if 'backend' in df.columns else 'unknown'
+    
+    data = pd.DataFrame({
+        'action': action,
+        'language': language,
+        'complexity': complexity,
+        'model': df['model'],
+        'backend': backend
+    })
+    return data.to_dict('records')
 
 def train_model_selector(data):
-    """Train random forest to predict best model"""
+    """Train gradient-boosted trees to predict best model"""
     if len(data) < 10:
         print(f"Not enough training data: {len(data)} samples")
         print("Need at least 10 successful task executions with feedback")
         return None
     
-    # Prepare features
-    X = []
-    y = []
-    
-    for sample in data:
-        features = [
-            sample['action'],
-            sample['language'],
-            sample['complexity']
-        ]
-        X.append(features)
-        y.append(sample['model'])
-    
-    # Encode categorical features
-    action_encoder = LabelEncoder()
-    language_encoder = LabelEncoder()
-    complexity_encoder = LabelEncoder()
-    model_encoder = LabelEncoder()
-    
-    X_encoded = np.column_stack([
-        action_encoder.fit_transform([x[0] for x in X]),
-        language_encoder.fit_transform([x[1] for x in X]),
-        complexity_encoder.fit_transform([x[2] for x in X])
-    ])
-    
-    y_encoded = model_encoder.fit_transform(y)
+    # Encode categorical features in one pass per column; categories are
+    # sorted, so codes match what LabelEncoder would produce
+    df = pd.DataFrame(data)
+    codes = {}
+    classes = {}
+    for col in ['action', 'language', 'complexity', 'model']:
+        cat = df[col].astype('category').cat
+        codes[col] = cat.codes.to_numpy()
+        classes[col] = cat.categories.tolist()
+    
+    X_encoded = np.column_stack([codes['action'], codes['language'], codes['complexity']])
+    y_encoded = codes['model']
     
     # Train/test split
     X_train, X_test, y_train, y_test = train_test_split(
         X_encoded, y_encoded, test_size=0.2, random_state=42
     )
     
-    # Train model
-    clf = RandomForestClassifier(n_estimators=100, random_state=42)
+    # Train model. Feedback sets are often only tens of rows, so leaves may
+    # hold a single sample, and the codes are split on as ordinals: native
+    # categorical splits ignore any category with fewer than ~10 training rows
+    clf = HistGradientBoostingClassifier(
+        max_iter=100,
+        min_samples_leaf=1,
+        random_state=42
+    )
     clf.fit(X_train, y_train)
     
     # Evaluate
@@ -151,9 +178,17 @@ def train_model_selector(data):
     print(f"Test samples: {len(X_test)}")
     print(f"Accuracy: {accuracy:.2%}")
     
+    # Boosted trees expose no impurity importances, so permute each feature
+    # over all rows (a test split of a few rows may not vary a feature at all).
+    # These are mean accuracy drops, so they are not normalized to sum to 1
+    # and can be slightly negative for features that do not help
+    importances = permutation_importance(
+        clf, X_encoded, y_encoded, n_repeats=5, random_state=42
+    ).importances_mean
+    
     print(f"\nModel distribution:")
-    model_counts = Counter(y)
-    for model, count in model_counts.most_common():
+    model_counts = df['model'].value_counts()
+    for model, count in model_counts.items():
         print(f"  {model}: {count} samples")
     
     # Save model and encoders
@@ -161,11 +196,11 @@ def train_model_selector(data):
     output_dir.mkdir(exist_ok=True)
     
     model_data = {
-        'feature_importances': clf.feature_importances_.tolist(),
-        'action_classes': action_encoder.classes_.tolist(),
-        'language_classes': language_encoder.classes_.tolist(),
-        'complexity_classes': complexity_encoder.classes_.tolist(),
-        'model_classes': model_encoder.classes_.tolist(),
+        'feature_importances': importances.tolist(),
+        'action_classes': classes['action'],
+        'language_classes': classes['language'],
+        'complexity_classes': classes['complexity'],
+        'model_classes': classes['model'],
         'accuracy': float(accuracy),
         'n_samples': len(data)
     }
@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 import json
-import numpy as np
+import math
+import re
 import sys
 from pathlib import Path
 
+# Known parameter-count tags; longer alternatives first so '33b' isn't read as '3b'
+_SIZE_RE = re.compile(r'(405|120|70|33|32|22|9|8|3)b')
+
+def _sigmoid(x):
+    # Split on sign so math.exp never overflows
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    e = math.exp(x)
+    return e / (1.0 + e)
+
 def load_model(model_path):
     with open(model_path, 'r') as f:
         return json.load(f)
@@ -11,14 +22,11 @@ def load_model(model_path):
 def extract_model_features(model_id):
     model_lower = model_id.lower()
     
-    has_coder = 1 if 'coder' in model_lower or 'code' in model_lower else 0
+    has_coder = 1 if 'code' in model_lower else 0  # also covers 'coder'
     has_instant = 1 if 'instant' in model_lower or 'flash' in model_lower else 0
     
-    model_size = 0
-    for size in ['405b', '120b', '70b', '32b', '33b', '22b', '9b', '8b', '3b']:
-        if size in model_lower:
-            model_size = int(size.replace('b', ''))
-            break
+    m = _SIZE_RE.search(model_lower)
+    model_size = int(m.group(1)) if m else 0
     
     return has_coder, has_instant, model_size
 
@@ -45,19 +53,22 @@ def predict(model_data, model_id, action, language, complexity, context_window,
     
     has_coder, has_instant, model_size = extract_model_features(model_id)
     
-    log_cost = np.log1p(cost_per_1m)
-    log_context = np.log1p(context_window)
-    
-    features = np.array([
+    # Eight features: plain Python beats NumPy's per-call dispatch overhead
+    features = (
         action_encoded, language_encoded, complexity_encoded,
-        log_cost, log_context, has_coder, has_instant, model_size
-    ])
+        math.log1p(cost_per_1m), math.log1p(context_window),
+        has_coder, has_instant, model_size
+    )
     
-    coef = np.array(model_data['coefficients'][0])
+    coef = model_data['coefficients'][0]
     intercept = model_data['intercept'][0]
+    if len(coef) != len(features):
+        raise ValueError(
+            f"model has {len(coef)} coefficients but {len(features)} features; retrain the model"
+        )
     
-    logit = np.dot(features, coef) + intercept
-    prob = 1 / (1 + np.exp(-logit))
+    logit = intercept + sum(f * c for f, c in zip(features, coef))
+    prob = _sigmoid(logit)
     
     return prob
 
@@ -9,8 +9,16 @@ import json
 import sys
 from pathlib import Path
 
+def read_csv(path):
+    """Read a CSV with Arrow's multithreaded parser when pyarrow is available."""
+    try:
+        return pd.read_csv(path, engine='pyarrow')
+    except (ImportError, ValueError):
+        # pyarrow missing, or input it can't parse (e.g. newlines in quotes)
+        return pd.read_csv(path)
+
 def load_data(data_path):
-    df = pd.read_csv(data_path)
+    df = read_csv(data_path)
     print(f"Loaded {len(df)} training samples")
     print(f"Success rate: {df['success'].mean():.2%}")
     return df
@@ -2,9 +2,11 @@
 """
 Add capabilities to model catalog based on known model characteristics.
 """
-import json
+import re
 from pathlib import Path
 
+from jsonio import dump_json_atomic, load_json
+
 # Known capabilities for specific models/families
 MODEL_CAPABILITIES = {
     # Groq models
@@ -68,11 +70,13 @@ MODEL_CAPABILITIES = {
     }
 }
 
+# All known keys in one alternation, so partial matching is a single scan
+_CAPABILITY_RE = re.compile("|".join(map(re.escape, MODEL_CAPABILITIES)))
+
 def add_capabilities_to_catalog(catalog_path: Path):
     """Add capabilities field to all models in catalog."""
     print(f"Loading catalog from {catalog_path}")
-    with open(catalog_path) as f:
-        catalog = json.load(f)
+    catalog = load_json(catalog_path)
     
     updated_count = 0
     total_count = 0
@@ -100,10 +104,9 @@ def add_capabilities_to_catalog(catalog_path: Path):
                 capabilities = MODEL_CAPABILITIES[model_name]
             else:
                 # Try partial matches for model families
-                for pattern, caps in MODEL_CAPABILITIES.items():
-                    if pattern in model_id or pattern in model_name:
-                        capabilities = caps
-                        break
+                match = _CAPABILITY_RE.search(model_id) or _CAPABILITY_RE.search(model_name)
+                if match:
+                    capabilities = MODEL_CAPABILITIES[match.group(0)]
             
             # Add capabilities if found
             if capabilities:
@@ -123,8 +126,7 @@ def add_capabilities_to_catalog(catalog_path: Path):
     print(f"\n📊 Updated {updated_count}/{total_count} models")
     print(f"💾 Saving to {catalog_path}")
     
-    with open(catalog_path, 'w') as f:
-        json.dump(catalog, f, indent=2)
+    dump_json_atomic(catalog_path, catalog)
     
     print("✅ Done!")
 
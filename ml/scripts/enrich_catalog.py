@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
-import json
 import sys
+from collections import namedtuple
 from pathlib import Path
+from types import MappingProxyType
 
-ENRICHMENT = {
+from jsonio import dump_json_atomic, load_json
+
+CATALOG_PATH = Path.home() / ".gptcode" / "models_catalog.json"
+
+Enrich = namedtuple("Enrich", "cost_per_1m rate_limit_daily context_window tokens_per_sec")
+
+_ENRICHMENT = {
     "openrouter": {
         "google/gemini-2.0-flash-exp:free": {
             "cost_per_1m": 0,
@@ -84,28 +91,67 @@ ENRICHMENT = {
     }
 }
 
+# Read-only view over the table with each record as a fixed-schema Enrich,
+# so enrichment assigns four known fields instead of a generic dict merge
+ENRICHMENT = MappingProxyType({
+    backend: MappingProxyType({
+        model_id: Enrich(**enrichment)
+        for model_id, enrichment in models.items()
+    })
+    for backend, models in _ENRICHMENT.items()
+})
+
+# (backend, model_id) -> enrichment, so the catalog is walked once with a
+# single lookup per model
+_FLAT_ENRICHMENT = {
+    (backend, model_id): enrichment
+    for backend, models in ENRICHMENT.items()
+    for model_id, enrichment in models.items()
+}
+
+def _enrich_backend(backend, section):
+    """Enrich one backend's models in place; returns (enriched, changed, messages)."""
+    enriched = 0
+    changed = False
+    messages = []
+    for model_dict in section.get("models", ()):
+        model_id = model_dict.get("id")
+        enrichment = _FLAT_ENRICHMENT.get((backend, model_id))
+        if enrichment is not None:
+            current = (
+                model_dict.get("cost_per_1m"),
+                model_dict.get("rate_limit_daily"),
+                model_dict.get("context_window"),
+                model_dict.get("tokens_per_sec"),
+            )
+            if current != enrichment:
+                model_dict["cost_per_1m"] = enrichment.cost_per_1m
+                model_dict["rate_limit_daily"] = enrichment.rate_limit_daily
+                model_dict["context_window"] = enrichment.context_window
+                model_dict["tokens_per_sec"] = enrichment.tokens_per_sec
+                changed = True
+            enriched += 1
+            messages.append(f"✓ Enriched {backend}/{model_id}\n")
+    return enriched, changed, messages
+
 def main():
-    home = Path.home()
-    catalog_path = home / ".gptcode" / "models_catalog.json"
+    catalog_path = CATALOG_PATH
     
-    with open(catalog_path) as f:
-        catalog = json.load(f)
+    catalog = load_json(catalog_path)
     
     enriched = 0
-    for backend, models_data in ENRICHMENT.items():
-        if backend not in catalog:
-            continue
-            
-        for model_dict in catalog[backend]["models"]:
-            model_id = model_dict.get("id")
-            if model_id in models_data:
-                enrichment = models_data[model_id]
-                model_dict.update(enrichment)
-                enriched += 1
-                print(f"✓ Enriched {backend}/{model_id}")
+    changed = False
+    messages = []
+    for backend, section in catalog.items():
+        backend_enriched, backend_changed, backend_messages = _enrich_backend(backend, section)
+        enriched += backend_enriched
+        changed = changed or backend_changed
+        messages.extend(backend_messages)
+    sys.stdout.write("".join(messages))
     
-    with open(catalog_path, "w") as f:
-        json.dump(catalog, f, indent=2)
+    # Reruns over an already enriched catalog leave it untouched
+    if changed:
+        dump_json_atomic(catalog_path, catalog)
     
     print(f"\n✓ Enriched {enriched} models")
 
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+JSON read/write helpers shared by the ~/.gptcode catalog and usage scripts.
+"""
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def load_json_file(f, size):
+    """Decode an open binary JSON file of the given size.
+
+    orjson is handed a read-only mapping of the file rather than a copy;
+    empty files, which cannot be mapped, and the stdlib fallback use json.load.
+    """
+    if orjson is None or size == 0:
+        return json.load(f)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+def load_json(path):
+    """Decode the JSON file at path."""
+    with open(path, "rb") as f:
+        return load_json_file(f, os.fstat(f.fileno()).st_size)
+
+def dump_json_atomic(path, obj):
+    """Write obj to path as 2-space indented JSON, atomically.
+
+    The data goes to a sibling temp file that is flushed and fsynced before
+    being swapped in, so a crash or power loss mid-write never leaves a
+    truncated file behind. Both backends write non-ASCII as raw UTF-8; only
+    the exponent format of some floats differs (1e-7 vs 1e-07).
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
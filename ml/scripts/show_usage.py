@@ -1,38 +1,132 @@
 #!/usr/bin/env python3
-import json
+import datetime
+import heapq
+import os
+import sys
+from collections import Counter
 from pathlib import Path
-from datetime import datetime, timedelta
+
+from jsonio import json_loads, load_json_file
+
+try:
+    import ijson
+except ImportError:  # optional: usage is parsed in one go
+    ijson = None
+
+USAGE_PATH = Path.home() / ".gptcode" / "usage.json"
+DAYS_SHOWN = 7
+STREAM_MIN_BYTES = 1_000_000
+NDJSON_TAIL_BYTES = 256 * 1024
+ERROR_PREVIEW_CHARS = 60
+
+_HEADER = "📊 Model Usage Statistics\n\n".encode()
+_TODAY = "🔥 ".encode()
+_DAY = "📅 ".encode()
+_OK = "  ✓ ".encode()
+_FAILING = "  ❌ ".encode()
+_LAST_ERROR = "     └─ Last error: ".encode()
+
+
+def _recent_ndjson_usage(ndjson_path):
+    """Aggregate the DAYS_SHOWN most recent days from an append-only usage log.
+
+    Each line is {"date", "model", "requests", "last_error"}. Lines are
+    appended in date order, so only the tail of the file is read, doubling
+    the window until it reaches a day older than the ones shown.
+    """
+    with open(ndjson_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        window = NDJSON_TAIL_BYTES
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read().split(b"\n")
+            if start:
+                lines = lines[1:]  # partial first line
+            records = [json_loads(line) for line in lines if line.strip()]
+            if start == 0 or len({r["date"] for r in records}) > DAYS_SHOWN:
+                break
+            window *= 2
+
+    # The same date and model strings repeat on every line; interning them
+    # keeps one copy each and lets the dict probes match by identity
+    intern = sys.intern
+    usage = {}
+    for record in records:
+        model_usage = usage.setdefault(intern(record["date"]), {}).setdefault(
+            intern(record["model"]), {"requests": 0, "last_error": None})
+        model_usage["requests"] += record.get("requests", 1)
+        if record.get("last_error"):
+            model_usage["last_error"] = record["last_error"]
+    return [(date, usage[date]) for date in heapq.nlargest(DAYS_SHOWN, usage)]
+
+def _recent_usage(usage_path):
+    """Return the DAYS_SHOWN most recent (date, models_data) pairs, newest first.
+
+    Returns None when there is no usage data. Each file is opened directly
+    and a missing one is detected from the open, so no separate existence
+    checks are made.
+    """
+    try:
+        return _recent_ndjson_usage(usage_path.with_suffix(".ndjson"))
+    except FileNotFoundError:
+        pass
+
+    try:
+        f = open(usage_path, "rb")
+    except FileNotFoundError:
+        return None
+
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if ijson is None or size < STREAM_MIN_BYTES:
+            usage = load_json_file(f, size)
+            return [(date, usage[date]) for date in heapq.nlargest(DAYS_SHOWN, usage)]
+        
+        # Keep a bounded min-heap of the newest dates so older days are
+        # discarded as soon as they are parsed
+        heap = []
+        for date, models_data in ijson.kvitems(f, "", use_float=True):
+            if len(heap) < DAYS_SHOWN:
+                heapq.heappush(heap, (date, models_data))
+            elif date > heap[0][0]:
+                heapq.heapreplace(heap, (date, models_data))
+    return sorted(heap, reverse=True)
 
 def main():
-    home = Path.home()
-    usage_path = home / ".gptcode" / "usage.json"
-    
-    if not usage_path.exists():
+    recent = _recent_usage(USAGE_PATH)
+    if recent is None:
         print("No usage data yet.")
         return
     
-    with open(usage_path) as f:
-        usage = json.load(f)
+    today = sys.intern(datetime.date.today().isoformat())
     
-    today = datetime.now().strftime("%Y-%m-%d")
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    # Build the whole report as UTF-8 bytes, with the fixed fragments encoded
+    # once at import, and emit it with a single write
+    buf = bytearray(_HEADER)
     
-    print("📊 Model Usage Statistics\n")
-    
-    for date in sorted(usage.keys(), reverse=True)[:7]:
-        models_data = usage[date]
-        print(f"{'🔥' if date == today else '📅'} {date}")
+    for date, models_data in recent:
+        buf += _TODAY if date == today else _DAY
+        buf += f"{date}\n".encode()
         
-        for model_key in sorted(models_data.keys(), key=lambda k: models_data[k]["requests"], reverse=True):
-            model_usage = models_data[model_key]
-            requests = model_usage["requests"]
-            last_error = model_usage.get("last_error")
+        counts = Counter({model_key: model_usage["requests"] for model_key, model_usage in models_data.items()})
+        for model_key, requests in counts.most_common():
+            last_error = models_data[model_key].get("last_error")
             
-            status = "❌" if last_error else "✓"
-            print(f"  {status} {model_key}: {requests} requests")
+            buf += _FAILING if last_error else _OK
+            buf += f"{model_key}: {requests} requests\n".encode()
             if last_error:
-                print(f"     └─ Last error: {last_error[:60]}...")
-        print()
+                buf += _LAST_ERROR
+                tail = last_error if len(last_error) <= ERROR_PREVIEW_CHARS else last_error[:ERROR_PREVIEW_CHARS] + "..."
+                buf += f"{tail}\n".encode()
+        buf += b"\n"
+    
+    stdout = getattr(sys.stdout, "buffer", None)
+    if stdout is None:
+        sys.stdout.write(buf.decode())
+    else:
+        sys.stdout.flush()
+        stdout.write(buf)
 
 if __name__ == "__main__":
     main()